@@ -4,8 +4,8 @@
 
 from __future__ import annotations
 
+import re
 import sys
-from types import MappingProxyType
 
 from ._re import (
     RE_DATETIME,
@@ -18,7 +18,7 @@ from ._re import (
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
     from typing import IO, Any, Final
 
     from ._types import Key, ParseFloat, Pos
@@ -34,17 +34,30 @@ if TYPE_CHECKING:
 # lower number than where mypyc binaries crash.
 MAX_INLINE_NESTING: Final = sys.getrecursionlimit()
 
-ASCII_CTRL: Final = frozenset(chr(i) for i in range(32)) | frozenset(chr(127))
+# Contents of regex character classes of the ASCII control characters
+# that are illegal in TOML. Tab is allowed everywhere, and newline in
+# multiline strings. Quotation mark and backslash are not included, as
+# they are handled as separate cases in the parser functions.
+_ILLEGAL_CHARS_RE_STR: Final = r"\x00-\x08\x0a-\x1f\x7f"
+_ILLEGAL_MULTILINE_CHARS_RE_STR: Final = r"\x00-\x08\x0b-\x1f\x7f"
+
+# A span of source that contains no escapes is validated with a single
+# regex search.
+RE_ILLEGAL_BASIC_STR_CHARS: Final = re.compile(f"[{_ILLEGAL_CHARS_RE_STR}]")
+RE_ILLEGAL_MULTILINE_BASIC_STR_CHARS: Final = re.compile(
+    f"[{_ILLEGAL_MULTILINE_CHARS_RE_STR}]"
+)
 
-# Neither of these sets include quotation mark or backslash. They are
-# currently handled as separate cases in the parser functions.
-ILLEGAL_BASIC_STR_CHARS: Final = ASCII_CTRL - frozenset("\t")
-ILLEGAL_MULTILINE_BASIC_STR_CHARS: Final = ASCII_CTRL - frozenset("\t\n")
+RE_ILLEGAL_LITERAL_STR_CHARS: Final = RE_ILLEGAL_BASIC_STR_CHARS
+RE_ILLEGAL_MULTILINE_LITERAL_STR_CHARS: Final = RE_ILLEGAL_MULTILINE_BASIC_STR_CHARS
 
-ILLEGAL_LITERAL_STR_CHARS: Final = ILLEGAL_BASIC_STR_CHARS
-ILLEGAL_MULTILINE_LITERAL_STR_CHARS: Final = ILLEGAL_MULTILINE_BASIC_STR_CHARS
+RE_ILLEGAL_COMMENT_CHARS: Final = RE_ILLEGAL_BASIC_STR_CHARS
 
-ILLEGAL_COMMENT_CHARS: Final = ILLEGAL_BASIC_STR_CHARS
+# Characters that end a run of verbatim characters in a basic string
+RE_BASIC_STR_STOP_CHARS: Final = re.compile(rf'["\\{_ILLEGAL_CHARS_RE_STR}]')
+RE_MULTILINE_BASIC_STR_STOP_CHARS: Final = re.compile(
+    rf'["\\{_ILLEGAL_MULTILINE_CHARS_RE_STR}]'
+)
 
 TOML_WS: Final = frozenset(" \t")
 TOML_WS_AND_NEWLINE: Final = TOML_WS | frozenset("\n")
@@ -52,19 +65,38 @@ BARE_KEY_CHARS: Final = frozenset(
     "abcdefghijklmnopqrstuvwxyz" "ABCDEFGHIJKLMNOPQRSTUVWXYZ" "0123456789" "-_"
 )
 KEY_INITIAL_CHARS: Final = BARE_KEY_CHARS | frozenset("\"'")
+# Regex equivalent of a run of `BARE_KEY_CHARS`. Bare keys are typically
+# long enough for a regex match to beat a Python loop over the characters.
+RE_BARE_KEY: Final = re.compile(r"[A-Za-z0-9_-]+")
+# A single bare key followed by "=", for the key/value pair fast path
+RE_BARE_KEY_AND_EQUALS: Final = re.compile(rf"({RE_BARE_KEY.pattern})[ \t]*=[ \t]*")
+DIGIT_CHARS: Final = frozenset("0123456789")
+# Characters that can end an integer value. The empty string stands for
+# the end of the document.
+INT_TERMINATOR_CHARS: Final = frozenset((" ", "\t", "\n", "#", ",", "]", "}", ""))
 HEXDIGIT_CHARS: Final = frozenset("abcdef" "ABCDEF" "0123456789")
 
-BASIC_STR_ESCAPE_REPLACEMENTS: Final = MappingProxyType(
-    {
-        "\\b": "\u0008",  # backspace
-        "\\t": "\u0009",  # tab
-        "\\n": "\u000A",  # linefeed
-        "\\f": "\u000C",  # form feed
-        "\\r": "\u000D",  # carriage return
-        '\\"': "\u0022",  # quote
-        "\\\\": "\u005C",  # backslash
-    }
+BASIC_STR_ESCAPE_REPLACEMENTS: Final = {
+    "\\b": "\u0008",  # backspace
+    "\\t": "\u0009",  # tab
+    "\\n": "\u000A",  # linefeed
+    "\\f": "\u000C",  # form feed
+    "\\r": "\u000D",  # carriage return
+    '\\"': "\u0022",  # quote
+    "\\\\": "\u005C",  # backslash
+}
+
+# A one-line basic string with no escapes other than those in
+# `BASIC_STR_ESCAPE_REPLACEMENTS`, including the closing quotation mark.
+_BASIC_STR_CHARS_RE_STR: Final = rf'[^"\\{_ILLEGAL_CHARS_RE_STR}]*'
+RE_SIMPLE_BASIC_STR: Final = re.compile(
+    _BASIC_STR_CHARS_RE_STR + r'(?:\\[btnfr"\\]' + _BASIC_STR_CHARS_RE_STR + r')*"'
 )
+RE_SIMPLE_ESCAPE: Final = re.compile(r'\\[btnfr"\\]')
+
+# Whitespace after a line ending backslash in a multiline basic string,
+# up to the next non-whitespace character. Must include a newline.
+RE_LINE_ENDING_BACKSLASH_WS: Final = re.compile(r"[ \t]*\n[ \t\n]*")
 
 
 class DEPRECATED_DEFAULT:
@@ -159,6 +191,9 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
     pos = 0
     out = Output()
     header: Key = ()
+    # The nest `header` points to. Cached to not walk the nested dict from
+    # its root for every key/value pair.
+    header_nest = out.data.dict
     parse_float = make_safe_parse_float(parse_float)
 
     # Parse one statement at a time
@@ -183,18 +218,14 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
             pos += 1
             continue
         if char in KEY_INITIAL_CHARS:
-            pos = key_value_rule(src, pos, out, header, parse_float)
+            pos = key_value_rule(src, pos, out, header, header_nest, parse_float)
             pos = skip_chars(src, pos, TOML_WS)
         elif char == "[":
-            try:
-                second_char: str | None = src[pos + 1]
-            except IndexError:
-                second_char = None
             out.flags.finalize_pending()
-            if second_char == "[":
-                pos, header = create_list_rule(src, pos, out)
+            if src.startswith("[[", pos):
+                pos, header, header_nest = create_list_rule(src, pos, out)
             else:
-                pos, header = create_dict_rule(src, pos, out)
+                pos, header, header_nest = create_dict_rule(src, pos, out)
             pos = skip_chars(src, pos, TOML_WS)
         elif char != "#":
             raise TOMLDecodeError("Invalid statement", src, pos)
@@ -217,13 +248,18 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
 
 
 class Flags:
-    """Flags that map to parsed keys/namespaces."""
+    """Flags that map to parsed keys/namespaces.
+
+    Flags of a namespace are stored as bits of an integer.
+    """
 
     # Marks an immutable namespace (inline array or inline table).
-    FROZEN: Final = 0
+    FROZEN: Final = 1
     # Marks a nest that has been explicitly created and can no longer
     # be opened using the "[table]" syntax.
-    EXPLICIT_NEST: Final = 1
+    EXPLICIT_NEST: Final = 2
+
+    __slots__ = ("_flags", "_pending_flags")
 
     def __init__(self) -> None:
         self._flags: dict[str, dict] = {}
@@ -250,31 +286,31 @@ class Flags:
         key_parent, key_stem = key[:-1], key[-1]
         for k in key_parent:
             if k not in cont:
-                cont[k] = {"flags": set(), "recursive_flags": set(), "nested": {}}
+                cont[k] = {"flags": 0, "recursive_flags": 0, "nested": {}}
             cont = cont[k]["nested"]
         if key_stem not in cont:
-            cont[key_stem] = {"flags": set(), "recursive_flags": set(), "nested": {}}
-        cont[key_stem]["recursive_flags" if recursive else "flags"].add(flag)
+            cont[key_stem] = {"flags": 0, "recursive_flags": 0, "nested": {}}
+        cont[key_stem]["recursive_flags" if recursive else "flags"] |= flag
 
     def is_(self, key: Key, flag: int) -> bool:
-        if not key:
-            return False  # document root has no flags
         cont = self._flags
         for k in key[:-1]:
             if k not in cont:
                 return False
             inner_cont = cont[k]
-            if flag in inner_cont["recursive_flags"]:
+            if inner_cont["recursive_flags"] & flag:
                 return True
             cont = inner_cont["nested"]
         key_stem = key[-1]
         if key_stem in cont:
             inner_cont = cont[key_stem]
-            return flag in inner_cont["flags"] or flag in inner_cont["recursive_flags"]
+            return bool((inner_cont["flags"] | inner_cont["recursive_flags"]) & flag)
         return False
 
 
 class NestedDict:
+    __slots__ = ("dict",)
+
     def __init__(self) -> None:
         # The parsed content of the TOML document
         self.dict: dict[str, Any] = {}
@@ -287,28 +323,33 @@ class NestedDict:
     ) -> dict:
         cont: Any = self.dict
         for k in key:
-            if k not in cont:
-                cont[k] = {}
-            cont = cont[k]
-            if access_lists and isinstance(cont, list):
+            cont = cont.setdefault(k, {})
+            # `type() is` checks suffice here: the nest only ever contains
+            # dicts and lists created by the parser, and `parse_float`
+            # return values that are guaranteed to not be dicts or lists.
+            if access_lists and type(cont) is list:
                 cont = cont[-1]
-            if not isinstance(cont, dict):
+            if type(cont) is not dict:
                 raise KeyError("There is no nest behind this key")
         return cont
 
-    def append_nest_to_list(self, key: Key) -> None:
+    def append_nest_to_list(self, key: Key) -> dict:
         cont = self.get_or_create_nest(key[:-1])
         last_key = key[-1]
+        nest: dict = {}
         if last_key in cont:
             list_ = cont[last_key]
             if not isinstance(list_, list):
                 raise KeyError("An object other than list found behind this key")
-            list_.append({})
+            list_.append(nest)
         else:
-            cont[last_key] = [{}]
+            cont[last_key] = [nest]
+        return nest
 
 
 class Output:
+    __slots__ = ("data", "flags")
+
     def __init__(self) -> None:
         self.data = NestedDict()
         self.flags = Flags()
@@ -328,7 +369,7 @@ def skip_until(
     pos: Pos,
     expect: str,
     *,
-    error_on: frozenset[str],
+    error_on: re.Pattern[str],
     error_on_eof: bool,
 ) -> Pos:
     try:
@@ -338,9 +379,9 @@ def skip_until(
         if error_on_eof:
             raise TOMLDecodeError(f"Expected {expect!r}", src, new_pos) from None
 
-    if not error_on.isdisjoint(src[pos:new_pos]):
-        while src[pos] not in error_on:
-            pos += 1
+    illegal_match = error_on.search(src, pos, new_pos)
+    if illegal_match:
+        pos = illegal_match.start()
         raise TOMLDecodeError(f"Found invalid character {src[pos]!r}", src, pos)
     return new_pos
 
@@ -352,7 +393,7 @@ def skip_comment(src: str, pos: Pos) -> Pos:
         char = None
     if char == "#":
         return skip_until(
-            src, pos + 1, "\n", error_on=ILLEGAL_COMMENT_CHARS, error_on_eof=False
+            src, pos + 1, "\n", error_on=RE_ILLEGAL_COMMENT_CHARS, error_on_eof=False
         )
     return pos
 
@@ -366,7 +407,7 @@ def skip_comments_and_array_ws(src: str, pos: Pos) -> Pos:
             return pos
 
 
-def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
+def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key, dict]:
     pos += 1  # Skip "["
     pos = skip_chars(src, pos, TOML_WS)
     pos, key = parse_key(src, pos)
@@ -375,7 +416,7 @@ def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
         raise TOMLDecodeError(f"Cannot declare {key} twice", src, pos)
     out.flags.set(key, Flags.EXPLICIT_NEST, recursive=False)
     try:
-        out.data.get_or_create_nest(key)
+        nest = out.data.get_or_create_nest(key)
     except KeyError:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
 
@@ -383,10 +424,10 @@ def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
         raise TOMLDecodeError(
             "Expected ']' at the end of a table declaration", src, pos
         )
-    return pos + 1, key
+    return pos + 1, key, nest
 
 
-def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
+def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key, dict]:
     pos += 2  # Skip "[["
     pos = skip_chars(src, pos, TOML_WS)
     pos, key = parse_key(src, pos)
@@ -398,7 +439,7 @@ def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
     # ...but this key precisely is still prohibited from table declaration
     out.flags.set(key, Flags.EXPLICIT_NEST, recursive=False)
     try:
-        out.data.append_nest_to_list(key)
+        nest = out.data.append_nest_to_list(key)
     except KeyError:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
 
@@ -406,38 +447,47 @@ def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
         raise TOMLDecodeError(
             "Expected ']]' at the end of an array declaration", src, pos
         )
-    return pos + 2, key
+    return pos + 2, key, nest
 
 
 def key_value_rule(
-    src: str, pos: Pos, out: Output, header: Key, parse_float: ParseFloat
+    src: str,
+    pos: Pos,
+    out: Output,
+    header: Key,
+    header_nest: dict,
+    parse_float: ParseFloat,
 ) -> Pos:
     pos, key, value = parse_key_value_pair(src, pos, parse_float, nest_lvl=0)
     key_parent, key_stem = key[:-1], key[-1]
-    abs_key_parent = header + key_parent
-
-    relative_path_cont_keys = (header + key[:i] for i in range(1, len(key)))
-    for cont_key in relative_path_cont_keys:
-        # Check that dotted key syntax does not redefine an existing table
-        if out.flags.is_(cont_key, Flags.EXPLICIT_NEST):
-            raise TOMLDecodeError(f"Cannot redefine namespace {cont_key}", src, pos)
-        # Containers in the relative path can't be opened with the table syntax or
-        # dotted key/value syntax in following table sections.
-        out.flags.add_pending(cont_key, Flags.EXPLICIT_NEST)
-
-    if out.flags.is_(abs_key_parent, Flags.FROZEN):
-        raise TOMLDecodeError(
-            f"Cannot mutate immutable namespace {abs_key_parent}", src, pos
-        )
-
-    try:
-        nest = out.data.get_or_create_nest(abs_key_parent)
-    except KeyError:
-        raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
+    if key_parent:
+        relative_path_cont_keys = (header + key[:i] for i in range(1, len(key)))
+        for cont_key in relative_path_cont_keys:
+            # Check that dotted key syntax does not redefine an existing table
+            if out.flags.is_(cont_key, Flags.EXPLICIT_NEST):
+                raise TOMLDecodeError(f"Cannot redefine namespace {cont_key}", src, pos)
+            # Containers in the relative path can't be opened with the table
+            # syntax or dotted key/value syntax in following table sections.
+            out.flags.add_pending(cont_key, Flags.EXPLICIT_NEST)
+
+        abs_key_parent = header + key_parent
+        if out.flags.is_(abs_key_parent, Flags.FROZEN):
+            raise TOMLDecodeError(
+                f"Cannot mutate immutable namespace {abs_key_parent}", src, pos
+            )
+        try:
+            nest = out.data.get_or_create_nest(abs_key_parent)
+        except KeyError:
+            raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
+    else:
+        # The header namespace itself is never frozen: table headers
+        # can't open a frozen namespace, and values only freeze
+        # namespaces below the header.
+        nest = header_nest
     if key_stem in nest:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos)
     # Mark inline table and array namespaces recursively immutable
-    if isinstance(value, (dict, list)):
+    if type(value) is dict or type(value) is list:
         out.flags.set(header + key, Flags.FROZEN, recursive=True)
     nest[key_stem] = value
     return pos
@@ -446,6 +496,11 @@ def key_value_rule(
 def parse_key_value_pair(
     src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
 ) -> tuple[Pos, Key, Any]:
+    # Fast path: a single bare key, followed by "=" and whitespace
+    bare_key_match = RE_BARE_KEY_AND_EQUALS.match(src, pos)
+    if bare_key_match:
+        pos, value = parse_value(src, bare_key_match.end(), parse_float, nest_lvl)
+        return pos, (bare_key_match.group(1),), value
     pos, key = parse_key(src, pos)
     try:
         char: str | None = src[pos]
@@ -478,14 +533,13 @@ def parse_key(src: str, pos: Pos) -> tuple[Pos, Key]:
 
 
 def parse_key_part(src: str, pos: Pos) -> tuple[Pos, str]:
+    bare_key_match = RE_BARE_KEY.match(src, pos)
+    if bare_key_match:
+        return bare_key_match.end(), bare_key_match.group()
     try:
         char: str | None = src[pos]
     except IndexError:
         char = None
-    if char in BARE_KEY_CHARS:
-        start_pos = pos
-        pos = skip_chars(src, pos, BARE_KEY_CHARS)
-        return pos, src[start_pos:pos]
     if char == "'":
         return parse_literal_str(src, pos)
     if char == '"':
@@ -495,9 +549,24 @@ def parse_key_part(src: str, pos: Pos) -> tuple[Pos, str]:
 
 def parse_one_line_basic_str(src: str, pos: Pos) -> tuple[Pos, str]:
     pos += 1
+    # Fast path: strings with no escapes, or with simple escapes only, are
+    # matched and unescaped with a regex. This also covers validation of
+    # illegal characters. Other strings, including invalid ones, are left
+    # for the general parser.
+    simple_match = RE_SIMPLE_BASIC_STR.match(src, pos)
+    if simple_match:
+        end_pos = simple_match.end()
+        result = src[pos : end_pos - 1]
+        if "\\" in result:
+            result = RE_SIMPLE_ESCAPE.sub(replace_simple_escape, result)
+        return end_pos, result
     return parse_basic_str(src, pos, multiline=False)
 
 
+def replace_simple_escape(match: re.Match) -> str:
+    return BASIC_STR_ESCAPE_REPLACEMENTS[match.group()]
+
+
 def parse_array(
     src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
 ) -> tuple[Pos, list]:
@@ -552,7 +621,7 @@ def parse_inline_table(
             return pos + 1, nested_dict.dict
         if c != ",":
             raise TOMLDecodeError("Unclosed inline table", src, pos)
-        if isinstance(value, (dict, list)):
+        if type(value) is dict or type(value) is list:
             flags.set(key, Flags.FROZEN, recursive=True)
         pos += 1
         pos = skip_chars(src, pos, TOML_WS)
@@ -566,16 +635,12 @@ def parse_basic_str_escape(
     if multiline and escape_id in {"\\ ", "\\\t", "\\\n"}:
         # Skip whitespace until next non-whitespace character or end of
         # the doc. Error if non-whitespace is found before newline.
-        if escape_id != "\\\n":
-            pos = skip_chars(src, pos, TOML_WS)
-            try:
-                char = src[pos]
-            except IndexError:
-                return pos, ""
-            if char != "\n":
-                raise TOMLDecodeError("Unescaped '\\' in a string", src, pos)
-            pos += 1
-        pos = skip_chars(src, pos, TOML_WS_AND_NEWLINE)
+        ws_match = RE_LINE_ENDING_BACKSLASH_WS.match(src, pos - 1)
+        if ws_match:
+            return ws_match.end(), ""
+        pos = skip_chars(src, pos, TOML_WS)
+        if pos < len(src):
+            raise TOMLDecodeError("Unescaped '\\' in a string", src, pos)
         return pos, ""
     if escape_id == "\\u":
         return parse_hex_char(src, pos, 4)
@@ -608,7 +673,7 @@ def parse_literal_str(src: str, pos: Pos) -> tuple[Pos, str]:
     pos += 1  # Skip starting apostrophe
     start_pos = pos
     pos = skip_until(
-        src, pos, "'", error_on=ILLEGAL_LITERAL_STR_CHARS, error_on_eof=True
+        src, pos, "'", error_on=RE_ILLEGAL_LITERAL_STR_CHARS, error_on_eof=True
     )
     return pos + 1, src[start_pos:pos]  # Skip ending apostrophe
 
@@ -624,14 +689,25 @@ def parse_multiline_str(src: str, pos: Pos, *, literal: bool) -> tuple[Pos, str]
             src,
             pos,
             "'''",
-            error_on=ILLEGAL_MULTILINE_LITERAL_STR_CHARS,
+            error_on=RE_ILLEGAL_MULTILINE_LITERAL_STR_CHARS,
             error_on_eof=True,
         )
         result = src[pos:end_pos]
         pos = end_pos + 3
     else:
         delim = '"'
-        pos, result = parse_basic_str(src, pos, multiline=True)
+        # Fast path: a string without escapes and illegal characters is
+        # a verbatim slice of the source.
+        end_pos = src.find('"""', pos)
+        if (
+            end_pos != -1
+            and src.find("\\", pos, end_pos) == -1
+            and not RE_ILLEGAL_MULTILINE_BASIC_STR_CHARS.search(src, pos, end_pos)
+        ):
+            result = src[pos:end_pos]
+            pos = end_pos + 3
+        else:
+            pos, result = parse_basic_str(src, pos, multiline=True)
 
     # Add at maximum two extra apostrophes/quotes if the end sequence
     # is 4 or 5 chars long instead of just 3.
@@ -644,36 +720,113 @@ def parse_multiline_str(src: str, pos: Pos, *, literal: bool) -> tuple[Pos, str]
     return pos, result + (delim * 2)
 
 
-def parse_basic_str(src: str, pos: Pos, *, multiline: bool) -> tuple[Pos, str]:
+def parse_basic_str(  # noqa: C901
+    src: str, pos: Pos, *, multiline: bool
+) -> tuple[Pos, str]:
     if multiline:
-        error_on = ILLEGAL_MULTILINE_BASIC_STR_CHARS
+        stop_on = RE_MULTILINE_BASIC_STR_STOP_CHARS
         parse_escapes = parse_basic_str_escape_multiline
     else:
-        error_on = ILLEGAL_BASIC_STR_CHARS
+        stop_on = RE_BASIC_STR_STOP_CHARS
         parse_escapes = parse_basic_str_escape
-    result = ""
+    parts: list[str] = []
     start_pos = pos
     while True:
+        # Skip a run of characters that are copied to the result verbatim.
+        # Escapes and quotes often follow each other directly, in which
+        # case there is no run to skip and the search is not worth its cost.
         try:
             char = src[pos]
         except IndexError:
             raise TOMLDecodeError("Unterminated string", src, pos) from None
+        if char != "\\" and char != '"':
+            stop_match = stop_on.search(src, pos)
+            if not stop_match:
+                raise TOMLDecodeError("Unterminated string", src, len(src))
+            pos = stop_match.start()
+            char = src[pos]
         if char == '"':
             if not multiline:
-                return pos + 1, result + src[start_pos:pos]
+                parts.append(src[start_pos:pos])
+                return pos + 1, "".join(parts)
             if src.startswith('"""', pos):
-                return pos + 3, result + src[start_pos:pos]
+                parts.append(src[start_pos:pos])
+                return pos + 3, "".join(parts)
             pos += 1
             continue
         if char == "\\":
-            result += src[start_pos:pos]
+            parts.append(src[start_pos:pos])
             pos, parsed_escape = parse_escapes(src, pos)
-            result += parsed_escape
+            parts.append(parsed_escape)
             start_pos = pos
             continue
-        if char in error_on:
-            raise TOMLDecodeError(f"Illegal character {char!r}", src, pos)
-        pos += 1
+        raise TOMLDecodeError(f"Illegal character {char!r}", src, pos)
+
+
+def parse_basic_str_value(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, str]:
+    if src.startswith('"""', pos):
+        return parse_multiline_str(src, pos, literal=False)
+    return parse_one_line_basic_str(src, pos)
+
+
+def parse_literal_str_value(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, str]:
+    if src.startswith("'''", pos):
+        return parse_multiline_str(src, pos, literal=True)
+    return parse_literal_str(src, pos)
+
+
+def parse_bool(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, bool]:
+    if src.startswith("true", pos):
+        return pos + 4, True
+    if src.startswith("false", pos):
+        return pos + 5, False
+    raise TOMLDecodeError("Invalid value", src, pos)
+
+
+def parse_unsigned_special_float(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    first_three = src[pos : pos + 3]
+    if first_three in {"inf", "nan"}:
+        return pos + 3, parse_float(first_three)
+    raise TOMLDecodeError("Invalid value", src, pos)
+
+
+def parse_signed_number(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    number_match = RE_NUMBER.match(src, pos)
+    if number_match:
+        return number_match.end(), match_to_number(number_match, parse_float)
+    first_four = src[pos : pos + 4]
+    if first_four in {"-inf", "+inf", "-nan", "+nan"}:
+        return pos + 4, parse_float(first_four)
+    raise TOMLDecodeError("Invalid value", src, pos)
+
+
+# Value parsers for values that can be identified by their first character
+# alone. Values starting with a digit are not included, as those need to be
+# told apart by regex matching.
+VALUE_PARSERS: Final[
+    dict[str, Callable[[str, Pos, ParseFloat, int], tuple[Pos, Any]]]
+] = {
+    '"': parse_basic_str_value,
+    "'": parse_literal_str_value,
+    "t": parse_bool,
+    "f": parse_bool,
+    "[": parse_array,
+    "{": parse_inline_table,
+    "i": parse_unsigned_special_float,
+    "n": parse_unsigned_special_float,
+    "+": parse_signed_number,
+    "-": parse_signed_number,
+}
 
 
 def parse_value(  # noqa: C901
@@ -688,51 +841,44 @@ def parse_value(  # noqa: C901
         )
 
     try:
-        char: str | None = src[pos]
+        char = src[pos]
     except IndexError:
-        char = None
-
-    # IMPORTANT: order conditions based on speed of checking and likelihood
-
-    # Basic strings
-    if char == '"':
-        if src.startswith('"""', pos):
-            return parse_multiline_str(src, pos, literal=False)
-        return parse_one_line_basic_str(src, pos)
-
-    # Literal strings
-    if char == "'":
-        if src.startswith("'''", pos):
-            return parse_multiline_str(src, pos, literal=True)
-        return parse_literal_str(src, pos)
-
-    # Booleans
-    if char == "t":
-        if src.startswith("true", pos):
-            return pos + 4, True
-    if char == "f":
-        if src.startswith("false", pos):
-            return pos + 5, False
-
-    # Arrays
-    if char == "[":
-        return parse_array(src, pos, parse_float, nest_lvl + 1)
-
-    # Inline tables
-    if char == "{":
-        return parse_inline_table(src, pos, parse_float, nest_lvl + 1)
-
-    # Dates and times
-    datetime_match = RE_DATETIME.match(src, pos)
-    if datetime_match:
+        raise TOMLDecodeError("Invalid value", src, pos) from None
+
+    # Strings, booleans, arrays, inline tables, special floats and
+    # signed numbers
+    value_parser = VALUE_PARSERS.get(char)
+    if value_parser is not None:
+        return value_parser(src, pos, parse_float, nest_lvl + 1)
+
+    # Fast path for decimal integers with no sign, underscores or leading
+    # zeros. These are the most common numbers and need no regex.
+    if char in DIGIT_CHARS:
+        end_pos = pos + 1
         try:
-            datetime_obj = match_to_datetime(datetime_match)
-        except ValueError as e:
-            raise TOMLDecodeError("Invalid date or datetime", src, pos) from e
-        return datetime_match.end(), datetime_obj
-    localtime_match = RE_LOCALTIME.match(src, pos)
-    if localtime_match:
-        return localtime_match.end(), match_to_localtime(localtime_match)
+            while src[end_pos] in DIGIT_CHARS:
+                end_pos += 1
+            end_char = src[end_pos]
+        except IndexError:
+            end_char = ""
+        if end_char in INT_TERMINATOR_CHARS and (char != "0" or end_pos == pos + 1):
+            return end_pos, int(src[pos:end_pos])
+
+    # Dates and times. Only probe for a date if the would-be year is
+    # followed by a hyphen, so that plain numbers skip the regex.
+    if src.startswith("-", pos + 4):
+        datetime_match = RE_DATETIME.match(src, pos)
+        if datetime_match:
+            try:
+                datetime_obj = match_to_datetime(datetime_match)
+            except ValueError as e:
+                raise TOMLDecodeError("Invalid date or datetime", src, pos) from e
+            return datetime_match.end(), datetime_obj
+    # Likewise, times have a colon after the two digit hour
+    if src.startswith(":", pos + 2):
+        localtime_match = RE_LOCALTIME.match(src, pos)
+        if localtime_match:
+            return localtime_match.end(), match_to_localtime(localtime_match)
 
     # Integers and "normal" floats.
     # The regex will greedily match any type starting with a decimal
@@ -741,14 +887,6 @@ def parse_value(  # noqa: C901
     if number_match:
         return number_match.end(), match_to_number(number_match, parse_float)
 
-    # Special floats
-    first_three = src[pos : pos + 3]
-    if first_three in {"inf", "nan"}:
-        return pos + 3, parse_float(first_three)
-    first_four = src[pos : pos + 4]
-    if first_four in {"-inf", "+inf", "-nan", "+nan"}:
-        return pos + 4, parse_float(first_four)
-
     raise TOMLDecodeError("Invalid value", src, pos)
 
 
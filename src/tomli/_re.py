@@ -7,6 +7,7 @@ from __future__ import annotations
 from datetime import date, datetime, time, timedelta, timezone, tzinfo
 from functools import lru_cache
 import re
+import sys
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -73,6 +74,16 @@ def match_to_datetime(match: re.Match) -> datetime | date:
         offset_hour_str,
         offset_minute_str,
     ) = match.groups()
+    if sys.version_info >= (3, 11) and hour_str is not None:
+        # Since Python 3.11 `datetime.fromisoformat` accepts every
+        # date-time that matches `RE_DATETIME`, except those with a
+        # lowercase "z" offset. Fall back to converting the groups
+        # one by one if it fails. Dates without a time are converted
+        # below, as `fromisoformat` would return a `datetime` for them.
+        try:
+            return datetime.fromisoformat(match.group())
+        except ValueError:
+            pass
     year, month, day = int(year_str), int(month_str), int(day_str)
     if hour_str is None:
         return date(year, month, day)